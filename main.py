@@ -3,12 +3,138 @@ import csv
 import os
 import re
 import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Set
+from typing import Dict, List, NamedTuple, Optional, Union
 from urllib.parse import urljoin
 
+import lxml.etree
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Number of pages fetched concurrently; the crawl is I/O-bound
+MAX_WORKERS = 16
+# Number of listing pages fetched together while scanning for the start date
+LISTING_BATCH_SIZE = 8
+# Number of detail pages fetched concurrently, shared by all name lookups
+DETAIL_WORKERS = 16
+
+# OFAC recent actions listing of sanctions list updates
+BASE_URL = "https://ofac.treasury.gov"
+LIST_URL = f"{BASE_URL}/recent-actions/sanctions-list-updates"
+
+# Content page links look like /recent-actions/YYYYMMDD
+_HREF_RE = re.compile(r"/recent-actions/\d{8}")
+# Dates like "December 03, 2025"
+_DATE_RE = re.compile(r"([A-Za-z]+ \d{1,2}, \d{4})")
+# Leading "LAST, First" of an individual, or the leading name of an entity,
+# stopping at the next comma, opening parenthesis or semicolon
+_PERSON_NAME_RE = re.compile(r'^\s*([^,(;\s][^,(;]*?)\s*,\s*([^,(;\s][^,(;]*?)\s*(?:[,(;]|$)')
+_ENTITY_NAME_RE = re.compile(r'^\s*([^,(;\s][^,(;]*?)\s*(?:[,(;]|$)')
+
+# Ethereum address: 0x followed by 40 hex digits (matched against lowercased text)
+_ETH_ADDRESS_RE = re.compile(r"\b0x[0-9a-f]{40}\b")
+
+# XPath expressions for the OFAC search and detail pages, compiled once
+_HIDDEN_INPUTS_XPATH = lxml.etree.XPath('//input[@type="hidden"]')
+_SEARCH_ROWS_XPATH = lxml.etree.XPath('//table[@id="gvSearchResults"]//tr')
+# Rows of the identification table, skipping the header row
+_IDENTIFICATION_ROWS_XPATH = lxml.etree.XPath(
+    '(//div[@id="ctl00_MainContent_pnlIdentification"]'
+    '//table[@id="ctl00_MainContent_gvIdentification"]//tr)[position() > 1]'
+)
+_CELLS_XPATH = lxml.etree.XPath("./td")
+_LINKS_XPATH = lxml.etree.XPath(".//a")
+
+# Per-thread lxml HTML parsers by encoding; a parser can't run on two threads at once
+_HTML_PARSERS = threading.local()
+
+# Only the search-result rows of the listing page are built into the soup
+_LISTING_STRAINER = SoupStrainer("div", class_=re.compile("search-result"))
+
+# OFAC sanctions search (ASP.NET form) and its cached hidden form fields
+SEARCH_URL = "https://sanctionssearch.ofac.treas.gov/"
+_SEARCH_FORM: dict = {}
+_SEARCH_FORM_LOCK = threading.Lock()
+# Search results by queried name, kept for the rest of the run
+_SEARCH_CACHE: dict = {}
+# Identifications by detail page URL, kept for the rest of the run
+_DETAIL_CACHE: dict = {}
+
+# Shared session so every request reuses pooled keep-alive connections.
+# Idempotent requests (the GETs) are also retried on throttling and
+# transient server errors; search POSTs are retried by query_ofac_search.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+))
+
+# Detail pages get their own pool: the lookups waiting on them run on the
+# main pool, so fetching them there could deadlock
+_DETAIL_EXECUTOR = ThreadPoolExecutor(max_workers=DETAIL_WORKERS)
+
+# Per-thread buffer for log lines while a name lookup is running
+_LOG_BUFFER = threading.local()
+
+
+def log(message: str):
+    """Log a message to stderr, or to the current thread's buffer if one is open."""
+    lines = getattr(_LOG_BUFFER, "lines", None)
+    if lines is None:
+        # One write per message so lines from other threads can't split it
+        sys.stderr.write(f"{message}\n")
+    else:
+        lines.append(f"{message}\n")
+
+
+@contextmanager
+def buffered_log():
+    """Collect the current thread's log messages and write them to stderr at once.
+    
+    Keeps the output of one name lookup together while other threads log, and
+    turns its many small writes into a single one.
+    """
+    _LOG_BUFFER.lines = []
+    try:
+        yield
+    finally:
+        sys.stderr.write("".join(_LOG_BUFFER.lines))
+        _LOG_BUFFER.lines = None
+
+
+def _call_buffered(func, *args):
+    """Call func on this thread, collecting its log messages instead of writing them.
+    
+    Returns:
+        tuple: (result of func, list of log lines) so the lines can be added
+        to another thread's buffer
+    """
+    _LOG_BUFFER.lines = []
+    try:
+        return func(*args), _LOG_BUFFER.lines
+    finally:
+        _LOG_BUFFER.lines = None
+
+
+class Addition(NamedTuple):
+    """A sanctioned name with an ETH address, added on date."""
+    date: datetime
+    name: str
+    address: str
+
+
+class Deletion(NamedTuple):
+    """A name removed from the SDN List on date."""
+    date: datetime
+    name: str
 
 
 def parse_date(date_str: str) -> datetime:
@@ -16,15 +142,15 @@ def parse_date(date_str: str) -> datetime:
     return datetime.strptime(date_str.strip(), "%B %d, %Y")
 
 
-def extract_content_links(html: str, base_url: str) -> List[tuple[str, datetime]]:
+def extract_content_links(html: bytes, base_url: str) -> List[tuple[str, datetime]]:
     """Extract content page links and their dates from HTML."""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml", parse_only=_LISTING_STRAINER)
     links = []
     
     # Find all search-result rows (they have "search-result" in class list)
-    for row in soup.find_all("div", class_=lambda x: x and "search-result" in x):
+    for row in soup.select('div[class*="search-result"]'):
         # Find the link to content page (pattern: /recent-actions/YYYYMMDD)
-        link_elem = row.find("a", href=re.compile(r"/recent-actions/\d{8}"))
+        link_elem = row.find("a", href=_HREF_RE)
         if not link_elem:
             continue
         
@@ -33,14 +159,14 @@ def extract_content_links(html: str, base_url: str) -> List[tuple[str, datetime]
             continue
         
         # Find the date in the second div with margin-top-1 class
-        date_divs = row.find_all("div", class_=lambda x: x and "margin-top-1" in x)
+        date_divs = row.select("div.margin-top-1")
         if not date_divs:
             continue
         
         # The date is in the text of the div, format: "December 03, 2025 -"
         date_text = date_divs[-1].get_text()
         # Extract date string like "December 03, 2025"
-        date_match = re.search(r"([A-Za-z]+ \d{1,2}, \d{4})", date_text)
+        date_match = _DATE_RE.search(date_text)
         if not date_match:
             continue
         
@@ -61,6 +187,44 @@ def clean_name(name: str) -> str:
     return name.strip()
 
 
+def _parse_name_text(text: str, min_parts: int) -> str:
+    """Build a name from the first min_parts comma-separated parts of text.
+    
+    Returns:
+        The cleaned name, or an empty string if text has fewer parts
+    """
+    parts = [p.strip() for p in text.split(",")]
+    if len(parts) < min_parts:
+        return ""
+    return clean_name(", ".join(parts[:min_parts]))
+
+
+def _extract_names(p_tag, min_parts: int) -> List[str]:
+    """Extract names from the paragraph following a section header.
+    
+    Returns:
+        List of names, one per <a> tag or a single name parsed from the text
+    """
+    names = []
+    
+    # Try to find <a> tags first, if none exist, parse text directly
+    a_tags = p_tag.find_all("a")
+    if a_tags:
+        for a_tag in a_tags:
+            name = _parse_name_text(a_tag.get_text().strip(), min_parts)
+            if name:
+                names.append(name)
+    else:
+        # No <a> tags, parse the paragraph text directly
+        # Format: "LAST, First (info)" or "LAST, First; address"
+        name_re = _PERSON_NAME_RE if min_parts == 2 else _ENTITY_NAME_RE
+        name_match = name_re.match(p_tag.get_text())
+        if name_match:
+            names.append(", ".join(name_match.groups()))
+    
+    return names
+
+
 def extract_content_data(url: str) -> tuple[List[str], List[str], List[str]]:
     """Extract individuals added, entities added, and deletions from a content page.
     
@@ -72,16 +236,16 @@ def extract_content_data(url: str) -> tuple[List[str], List[str], List[str]]:
     deletions = []
     
     try:
-        response = requests.get(url, timeout=30)
+        response = SESSION.get(url, timeout=30)
         response.raise_for_status()
     except requests.RequestException as e:
-        print(f"Error fetching {url}: {e}", file=sys.stderr)
+        log(f"Error fetching {url}: {e}")
         return individuals_added, entities_added, deletions
     
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = BeautifulSoup(response.content, "lxml")
     
     # Find the main content div
-    field_item = soup.find("div", class_="field__item") or soup.select_one("div.field__item")
+    field_item = soup.select_one("div.field__item")
     if not field_item:
         return individuals_added, entities_added, deletions
     
@@ -91,271 +255,234 @@ def extract_content_data(url: str) -> tuple[List[str], List[str], List[str]]:
         headers = soup.find_all(["h3", "h4"])
     
     for header in headers:
-        header_text = header.get_text().lower().strip()
+        header_text = header.get_text().lower()
+        added = "added" in header_text
         
-        # Check for individuals added (handle both "individual" and "individuals")
-        if ("individual" in header_text or "individuals" in header_text) and "added" in header_text:
-            next_p = header.find_next("p")
-            if next_p:
-                # Try to find <a> tags first, if none exist, parse text directly
-                a_tags = next_p.find_all("a")
-                if a_tags:
-                    for a_tag in a_tags:
-                        text = a_tag.get_text().strip()
-                        if not text:
-                            continue
-                        parts = [p.strip() for p in text.split(",")]
-                        if len(parts) >= 2:
-                            name = clean_name(f"{parts[0]}, {parts[1]}")
-                            individuals_added.append(name)
-                else:
-                    # No <a> tags, parse the paragraph text directly
-                    # Extract name from the beginning: "LAST, First (additional info)"
-                    text = next_p.get_text().strip()
-                    if text:
-                        # Extract name before first opening parenthesis or semicolon
-                        # Format: "LAST, First (info)" or "LAST, First; address"
-                        name_match = re.match(r'^([^\(;]+?)(?:\s*\(|;|$)', text)
-                        if name_match:
-                            name_text = name_match.group(1).strip()
-                            # Remove trailing commas and clean up
-                            name_text = name_text.rstrip(',').strip()
-                            parts = [p.strip() for p in name_text.split(",")]
-                            if len(parts) >= 2:
-                                name = clean_name(f"{parts[0]}, {parts[1]}")
-                                if name:
-                                    individuals_added.append(name)
-        
-        # Check for entities added (handle both "entity" and "entities")
-        elif ("entity" in header_text or "entities" in header_text) and "added" in header_text:
-            next_p = header.find_next("p")
-            if next_p:
-                # Try to find <a> tags first, if none exist, parse text directly
-                a_tags = next_p.find_all("a")
-                if a_tags:
-                    for a_tag in a_tags:
-                        text = a_tag.get_text().strip()
-                        if not text:
-                            continue
-                        parts = [p.strip() for p in text.split(",")]
-                        if len(parts) >= 1:
-                            name = clean_name(parts[0])
-                            entities_added.append(name)
-                else:
-                    # No <a> tags, parse the paragraph text directly
-                    text = next_p.get_text().strip()
-                    if text:
-                        # Extract entity name before first opening parenthesis or semicolon
-                        name_match = re.match(r'^([^\(;]+?)(?:\s*\(|;|$)', text)
-                        if name_match:
-                            name_text = name_match.group(1).strip()
-                            # Remove trailing commas and clean up
-                            name_text = name_text.rstrip(',').strip()
-                            parts = [p.strip() for p in name_text.split(",")]
-                            if len(parts) >= 1:
-                                name = clean_name(parts[0])
-                                if name:
-                                    entities_added.append(name)
+        # Pick the list this section feeds and how many name parts it needs:
+        # individuals and deletions are "LAST, First", entities are a single name.
+        # "individual"/"deletion" also match their plurals; "entities" does not
+        # contain "entity" so both spellings are checked.
+        if added and "individual" in header_text:
+            names, min_parts = individuals_added, 2
+        elif added and ("entity" in header_text or "entities" in header_text):
+            names, min_parts = entities_added, 1
+        elif "deletion" in header_text:
+            names, min_parts = deletions, 2
+        else:
+            continue
         
-        # Check for deletions
-        elif "deletions" in header_text or "deletion" in header_text:
-            next_p = header.find_next("p")
-            if next_p:
-                # Try to find <a> tags first, if none exist, parse text directly
-                a_tags = next_p.find_all("a")
-                if a_tags:
-                    for a_tag in a_tags:
-                        text = a_tag.get_text().strip()
-                        if not text:
-                            continue
-                        parts = [p.strip() for p in text.split(",")]
-                        if len(parts) >= 2:
-                            name = clean_name(f"{parts[0]}, {parts[1]}")
-                            deletions.append(name)
-                else:
-                    # No <a> tags, parse the paragraph text directly
-                    text = next_p.get_text().strip()
-                    if text:
-                        # Extract name before first opening parenthesis or semicolon
-                        name_match = re.match(r'^([^\(;]+?)(?:\s*\(|;|$)', text)
-                        if name_match:
-                            name_text = name_match.group(1).strip()
-                            # Remove trailing commas and clean up
-                            name_text = name_text.rstrip(',').strip()
-                            parts = [p.strip() for p in name_text.split(",")]
-                            if len(parts) >= 2:
-                                name = clean_name(f"{parts[0]}, {parts[1]}")
-                                if name:
-                                    deletions.append(name)
+        next_p = header.find_next("p")
+        if next_p:
+            names.extend(_extract_names(next_p, min_parts))
     
     return individuals_added, entities_added, deletions
 
 
-def query_ofac_search(name: str) -> List[dict]:
+def _parse_html(response: requests.Response) -> lxml.html.HtmlElement:
+    """Parse a response with lxml, decoding it with the charset the server declared.
+    
+    lxml would otherwise fall back to Latin-1 for pages without a <meta charset>.
+    """
+    encoding = response.encoding or "utf-8"
+    parsers = getattr(_HTML_PARSERS, "by_encoding", None)
+    if parsers is None:
+        parsers = _HTML_PARSERS.by_encoding = {}
+    parser = parsers.get(encoding)
+    if parser is None:
+        try:
+            parser = lxml.html.HTMLParser(encoding=encoding)
+        except LookupError:
+            # Unknown charset in the Content-Type header
+            parser = lxml.html.HTMLParser(encoding="utf-8")
+        parsers[encoding] = parser
+    return lxml.html.fromstring(response.content, parser=parser)
+
+
+def get_search_form(refresh: bool = False) -> dict:
+    """Get the hidden ASP.NET form fields (ViewState etc.) of the OFAC search page.
+    
+    The search page is fetched once and the fields are cached for later searches.
+    
+    Args:
+        refresh: Fetch the search page again instead of using the cached fields
+    
+    Returns:
+        Dict of form field names to values, empty if the page could not be loaded
+    """
+    # Searches run on worker threads; only one of them fetches the page
+    with _SEARCH_FORM_LOCK:
+        if not _SEARCH_FORM or refresh:
+            form_data = _fetch_search_form()
+            if not form_data:
+                return {}
+            _SEARCH_FORM.clear()
+            _SEARCH_FORM.update(form_data)
+        return dict(_SEARCH_FORM)
+
+
+def _fetch_search_form() -> dict:
+    """Fetch the OFAC search page and extract its form fields.
+    
+    Returns:
+        Dict of form field names to values, empty if the page could not be loaded
+    """
+    try:
+        log(f"    GET {SEARCH_URL}")
+        response = SESSION.get(SEARCH_URL, timeout=30)
+        response.raise_for_status()
+        log(f"    Got search page (status {response.status_code})")
+    except requests.RequestException as e:
+        log(f"Error fetching search page: {e}")
+        return {}
+    
+    try:
+        tree = _parse_html(response)
+    except lxml.etree.ParserError as e:
+        log(f"Error parsing search page: {e}")
+        return {}
+    
+    # Extract ViewState and other hidden form fields
+    form_data = {}
+    
+    # Get all hidden inputs
+    for hidden_input in _HIDDEN_INPUTS_XPATH(tree):
+        input_name = hidden_input.get("name")
+        input_value = hidden_input.get("value", "")
+        if input_name:
+            form_data[input_name] = input_value
+    
+    # Set other required fields to defaults
+    form_data["ctl00$MainContent$ddlType"] = ""  # All
+    form_data["ctl00$MainContent$txtID"] = ""
+    form_data["ctl00$MainContent$txtAddress"] = ""
+    form_data["ctl00$MainContent$txtCity"] = ""
+    form_data["ctl00$MainContent$txtState"] = ""
+    form_data["ctl00$MainContent$ddlCountry"] = ""
+    form_data["ctl00$MainContent$ddlList"] = ""
+    form_data["ctl00$MainContent$Slider1"] = "100"
+    form_data["ctl00$MainContent$Slider1_Boundcontrol"] = "100"
+    
+    return form_data
+
+
+def query_ofac_search(name: str) -> tuple[dict, ...]:
     """Query OFAC sanctions search page for a name and return results.
     
+    Results are cached for the run and returned as a tuple so callers can't
+    change the cached copy.
+    
     Returns:
-        List of dicts with keys: name, address, type, program, list_type, score, detail_url
+        Tuple of dicts with keys: name, address, type, program, list_type, score, detail_url
     """
-    search_url = "https://sanctionssearch.ofac.treas.gov/"
+    # The same name can be added on several content pages in one run
+    if name in _SEARCH_CACHE:
+        return _SEARCH_CACHE[name]
+    
     results = []
     
-    with requests.Session() as session:
-        try:
-            print(f"    GET {search_url}", file=sys.stderr)
-            response = session.get(search_url, timeout=30)
-            response.raise_for_status()
-            print(f"    Got search page (status {response.status_code})", file=sys.stderr)
-        except requests.RequestException as e:
-            print(f"Error fetching search page: {e}", file=sys.stderr)
-            return results
-        
-        soup = BeautifulSoup(response.text, "html.parser")
-        
-        # Extract ViewState and other hidden form fields
-        form_data = {}
+    # Retry once with a freshly fetched form if the server rejects the cached ViewState
+    for refresh in (False, True):
+        search_form = get_search_form(refresh=refresh)
+        if not search_form:
+            return tuple(results)
         
-        # Get all hidden inputs
-        for hidden_input in soup.find_all("input", type="hidden"):
-            input_name = hidden_input.get("name")
-            input_value = hidden_input.get("value", "")
-            if input_name:
-                form_data[input_name] = input_value
-
-        # Set the name field
-        form_data["ctl00$MainContent$txtLastName"] = name
-        
-        # Set other required fields to defaults
-        form_data["ctl00$MainContent$ddlType"] = ""  # All
-        form_data["ctl00$MainContent$txtID"] = ""
-        form_data["ctl00$MainContent$txtAddress"] = ""
-        form_data["ctl00$MainContent$txtCity"] = ""
-        form_data["ctl00$MainContent$txtState"] = ""
-        form_data["ctl00$MainContent$ddlCountry"] = ""
-        form_data["ctl00$MainContent$ddlList"] = ""
-        form_data["ctl00$MainContent$Slider1"] = "100"
-        form_data["ctl00$MainContent$Slider1_Boundcontrol"] = "100"
-        
-        # IMPORTANT: Include the search button to trigger the search
-        form_data["ctl00$MainContent$btnSearch"] = "Search"
+        form_data = {
+            **search_form,
+            "ctl00$MainContent$txtLastName": name,
+            # IMPORTANT: Include the search button to trigger the search
+            "ctl00$MainContent$btnSearch": "Search",
+        }
         
         try:
-            print(f"    POST {search_url} (searching for: {name})", file=sys.stderr)
-            response = session.post(search_url, data=form_data, timeout=30)
+            log(f"    POST {SEARCH_URL} (searching for: {name})")
+            response = SESSION.post(SEARCH_URL, data=form_data, timeout=30)
             response.raise_for_status()
-            print(f"    Got search results (status {response.status_code}, size {len(response.text)} bytes)", file=sys.stderr)
+            log(f"    Got search results (status {response.status_code}, size {len(response.content)} bytes)")
+            break
         except requests.RequestException as e:
-            print(f"    Error posting search: {e}", file=sys.stderr)
-            return results
-        
-        # Parse results
-        soup = BeautifulSoup(response.text, "html.parser")
-        
-        # Debug: Check if results section exists
-        results_label = soup.find("span", id="ctl00_MainContent_lblResults")
-        
-        # Find the results table
-        results_table = soup.find("table", id="gvSearchResults")
-        
-        if not results_table:
-            # Check if results div exists
-            results_div = soup.find("div", id="scrollResults")
-            if results_div:
-                # Check what's inside the div
-                results_table = results_div.find("table", id="gvSearchResults")
-        
-        if not results_table:
-            # Try finding any table with gvSearchResults
-            all_tables = soup.find_all("table")
-            for table in all_tables:
-                if table.get("id") == "gvSearchResults":
-                    results_table = table
-                    break
+            log(f"    Error posting search: {e}")
+            if refresh:
+                return tuple(results)
+    
+    # Parse results
+    try:
+        tree = _parse_html(response)
+    except lxml.etree.ParserError as e:
+        log(f"    Error parsing search results: {e}")
+        return tuple(results)
+    
+    # Rows of the results table
+    rows = _SEARCH_ROWS_XPATH(tree)
+    
+    for row in rows:
+        cells = _CELLS_XPATH(row)
+        if len(cells) >= 6:
+            name_cell = cells[0]
+            name_links = _LINKS_XPATH(name_cell)
+            name_link = name_links[0] if name_links else None
+            name_text = name_link.text_content().strip() if name_link is not None else name_cell.text_content().strip()
+            detail_url = ""
+            if name_link is not None and name_link.get("href"):
+                detail_url = urljoin(SEARCH_URL, name_link.get("href"))
             
-            if not results_table:
-                return results
-        
-
-
-        rows = results_table.find_all("tr")
-        
-        if not rows:
-            return results
-        
-        for row in rows:
-            cells = row.find_all("td")
-            if len(cells) >= 6:
-                name_cell = cells[0]
-                name_link = name_cell.find("a")
-                name_text = name_link.get_text().strip() if name_link else name_cell.get_text().strip()
-                detail_url = ""
-                if name_link and name_link.get("href"):
-                    detail_url = urljoin(search_url, name_link.get("href"))
-                
-                address = cells[1].get_text().strip()
-                entity_type = cells[2].get_text().strip()
-                program = cells[3].get_text().strip()
-                list_type = cells[4].get_text().strip()
-                score = cells[5].get_text().strip()
-                
-                results.append({
-                    "name": name_text,
-                    "address": address,
-                    "type": entity_type,
-                    "program": program,
-                    "list_type": list_type,
-                    "score": score,
-                    "detail_url": detail_url
-                })
+            address = cells[1].text_content().strip()
+            entity_type = cells[2].text_content().strip()
+            program = cells[3].text_content().strip()
+            list_type = cells[4].text_content().strip()
+            score = cells[5].text_content().strip()
+            
+            results.append({
+                "name": name_text,
+                "address": address,
+                "type": entity_type,
+                "program": program,
+                "list_type": list_type,
+                "score": score,
+                "detail_url": detail_url
+            })
     
+    results = tuple(results)
+    _SEARCH_CACHE[name] = results
     return results
 
 
-def get_identification_details(detail_url: str) -> List[dict]:
+def get_identification_details(detail_url: str) -> tuple[dict, ...]:
     """Fetch detail page and extract identification information.
     
+    Pages are cached by URL, so a detail page shared by several search
+    results or names is fetched once per run. Failed fetches are not cached.
+    
     Returns:
-        List of dicts with keys: type, id_number
+        Tuple of dicts with keys: type, id_number
     """
+    if detail_url in _DETAIL_CACHE:
+        return _DETAIL_CACHE[detail_url]
+    
     identifications = []
     
     try:
-        print(f"    GET {detail_url}", file=sys.stderr)
-        response = requests.get(detail_url, timeout=30)
+        log(f"    GET {detail_url}")
+        response = SESSION.get(detail_url, timeout=30)
         response.raise_for_status()
-        print(f"    Got detail page (status {response.status_code}, size {len(response.text)} bytes)", file=sys.stderr)
+        log(f"    Got detail page (status {response.status_code}, size {len(response.content)} bytes)")
     except requests.RequestException as e:
-        print(f"Error fetching detail page {detail_url}: {e}", file=sys.stderr)
-        return identifications
-    
-    soup = BeautifulSoup(response.text, "html.parser")
-    
-    # Find the identification panel
-    ident_panel = soup.find("div", id="ctl00_MainContent_pnlIdentification")
-    if not ident_panel:
-        return identifications
+        log(f"Error fetching detail page {detail_url}: {e}")
+        return tuple(identifications)
     
-    # Find the identification table
-    ident_table = ident_panel.find("table", id="ctl00_MainContent_gvIdentification")
-    if not ident_table:
-        return identifications
-    
-    # Extract rows - try tbody first, then direct children
-    tbody = ident_table.find("tbody")
-    if tbody:
-        all_rows = tbody.find_all("tr")
-    else:
-        # No tbody, rows are direct children of table
-        all_rows = ident_table.find_all("tr")
+    try:
+        tree = _parse_html(response)
+    except lxml.etree.ParserError as e:
+        log(f"Error parsing detail page {detail_url}: {e}")
+        return tuple(identifications)
     
-    # Skip header row (first row)
-    rows = all_rows[1:] if len(all_rows) > 1 else []
+    # Rows of the identification table, skipping the header row
+    rows = _IDENTIFICATION_ROWS_XPATH(tree)
     
     for row in rows:
-        cells = row.find_all("td")
+        cells = _CELLS_XPATH(row)
         if len(cells) >= 2:
-            id_type = cells[0].get_text().strip()
-            id_number = cells[1].get_text().strip()
+            id_type = cells[0].text_content().strip()
+            id_number = cells[1].text_content().strip()
             
             # Skip empty rows
             if not id_type and not id_number:
@@ -366,50 +493,76 @@ def get_identification_details(detail_url: str) -> List[dict]:
                 "id_number": id_number
             })
     
+    identifications = tuple(identifications)
+    _DETAIL_CACHE[detail_url] = identifications
     return identifications
 
 
-def extract_eth_address(identifications: List[dict]) -> List[str]:
+def extract_eth_address(identifications: tuple[dict, ...]) -> List[str]:
     """Extract Ethereum address from identifications if present.
     
     Returns:
-        List of Ethereum addresses
+        List of unique lowercased Ethereum addresses, in the order found
     """
-    addresses = []
-    for ident in identifications:
-        if ident["type"] == "Digital Currency Address - ETH":
-            addresses.append(ident["id_number"].strip().lower())
-    return addresses
+    # One finditer pass feeding dict.fromkeys, which drops repeats in order
+    return list(dict.fromkeys(
+        match.group(0)
+        for ident in identifications
+        if ident["type"] == "Digital Currency Address - ETH"
+        for match in _ETH_ADDRESS_RE.finditer(ident["id_number"].lower())
+    ))
 
 
-def load_existing_names(csv_path: str = "data.csv") -> Set[str]:
-    """Load names from data.csv into a set.
+def load_data_csv(csv_path: str = "data.csv") -> tuple[Dict[str, str], Optional[datetime], Optional[List[dict]]]:
+    """Read data.csv once and collect everything the run needs from it.
     
     Returns:
-        Set of names from the CSV file
+        tuple: (names, last_date, rows) where names maps casefolded names to
+        the names as written in the file, last_date is the latest date_added
+        (or None) and rows is the list of row dicts. rows is None if the file
+        exists but could not be read.
     """
-    names = set()
+    names = {}
+    last_date = None
     
     if not os.path.exists(csv_path):
-        print(f"Warning: {csv_path} not found, starting with empty set", file=sys.stderr)
-        return names
+        log(f"Warning: {csv_path} not found, starting with empty set")
+        return names, last_date, []
     
     try:
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                name = row.get('name', '').strip()
-                if name:
-                    names.add(name)
-        print(f"Loaded {len(names)} names from {csv_path}", file=sys.stderr)
+        with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            # Skip blank lines, as csv.DictReader does
+            rows = [dict(zip(header, r)) for r in reader if r]
     except Exception as e:
-        print(f"Error reading {csv_path}: {e}", file=sys.stderr)
+        log(f"Error reading {csv_path}: {e}")
+        return names, last_date, None
     
-    return names
+    for row in rows:
+        name = row.get('name', '').strip()
+        if name:
+            names[name.casefold()] = name
+        
+        date_str = row.get('date_added', '').strip()
+        if date_str:
+            try:
+                date_obj = datetime.strptime(date_str, "%Y-%m-%d")
+            except ValueError:
+                continue
+            if last_date is None or date_obj > last_date:
+                last_date = date_obj
+    
+    log(f"Loaded {len(names)} names from {csv_path}")
+    return names, last_date, rows
 
 
-def get_last_processed_date(log_path: str = "log.txt", csv_path: str = "data.csv") -> datetime:
-    """Get the last processed date from log.txt or data.csv.
+def get_last_processed_date(log_path: str = "log.txt", csv_last_date: datetime = None) -> datetime:
+    """Get the last processed date from log.txt, falling back to data.csv.
+    
+    Args:
+        log_path: Path to the log file
+        csv_last_date: Latest date_added in data.csv, as returned by load_data_csv
     
     Returns:
         datetime object representing the last processed date, or None if not found
@@ -422,168 +575,270 @@ def get_last_processed_date(log_path: str = "log.txt", csv_path: str = "data.csv
                 if date_str:
                     return datetime.strptime(date_str, "%Y-%m-%d")
         except Exception as e:
-            print(f"Warning: Error reading {log_path}: {e}", file=sys.stderr)
-    
-    # If log.txt doesn't exist or is empty, try data.csv
-    if os.path.exists(csv_path):
-        try:
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                last_date = None
-                for row in reader:
-                    date_str = row.get('date_added', '').strip()
-                    if date_str:
-                        try:
-                            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-                            if last_date is None or date_obj > last_date:
-                                last_date = date_obj
-                        except ValueError:
-                            continue
-                if last_date:
-                    print(f"Using last date from {csv_path}: {last_date.date()}", file=sys.stderr)
-                    return last_date
-        except Exception as e:
-            print(f"Warning: Error reading {csv_path}: {e}", file=sys.stderr)
+            log(f"Warning: Error reading {log_path}: {e}")
     
-    return None
+    # If log.txt doesn't exist or is empty, use the latest date in data.csv
+    if csv_last_date:
+        log(f"Using last date from data.csv: {csv_last_date.date()}")
+    return csv_last_date
 
 
 def save_last_processed_date(date: datetime, log_path: str = "log.txt"):
     """Save the last processed date to log.txt.
     
+    The date is written to a temporary file with a single write and moved over
+    log.txt, so an interrupted run never leaves a truncated log behind.
+    
     Args:
         date: datetime object to save
         log_path: Path to the log file
     """
+    tmp_path = f"{log_path}.tmp"
     try:
-        with open(log_path, 'w', encoding='utf-8') as f:
-            f.write(date.strftime("%Y-%m-%d"))
-        print(f"Saved last processed date to {log_path}: {date.date()}", file=sys.stderr)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, date.strftime("%Y-%m-%d").encode("utf-8"))
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, log_path)
+        log(f"Saved last processed date to {log_path}: {date.date()}")
     except Exception as e:
-        print(f"Warning: Error saving to {log_path}: {e}", file=sys.stderr)
+        log(f"Warning: Error saving to {log_path}: {e}")
+
+
+def _row_key(row: dict) -> tuple:
+    """Key identifying a CSV row: (date_added, lowercased address, name)."""
+    return (
+        row.get('date_added', '').strip(),
+        row.get('address', '').lower().strip(),
+        row.get('name', '').strip(),
+    )
 
 
-def update_data_csv(changes: List[tuple], csv_path: str = "data.csv"):
+def _format_csv_row(row: dict) -> str:
+    """Format a row as a CSV line, always quoting the name field."""
+    # Escape quotes in name by doubling them (CSV standard)
+    escaped_name = row.get('name', '').replace('"', '""')
+    return f'{row.get("date_added", "")},{row.get("address", "")},"{escaped_name}"\n'
+
+
+def update_data_csv(changes: List[Union[Addition, Deletion]], csv_path: str = "data.csv", rows: List[dict] = None):
     """Update data.csv file based on changes, processing them in chronological order.
     
     Args:
         changes: List of changes in chronological order, where each change is either:
-            - (date, name) for deletions
-            - (date, name, address) for additions
+            - Deletion(date, name) for deletions
+            - Addition(date, name, address) for additions
         csv_path: Path to the CSV file
+        rows: Existing rows already read by load_data_csv; read from csv_path if None
     """
     # Read existing data
-    rows = []
-    if os.path.exists(csv_path):
-        try:
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    rows.append(row)
-        except Exception as e:
-            print(f"Warning: Error reading {csv_path}: {e}", file=sys.stderr)
+    if rows is None:
+        _, _, rows = load_data_csv(csv_path)
+        if rows is None:
             return
     
+    # Normalize every row once into its (date, address, name) key, then index
+    # the keys for duplicate checks and row positions by casefolded name for deletions
+    keys = [_row_key(row) for row in rows]
+    seen = set(keys)
+    by_name = defaultdict(list)
+    for i, key in enumerate(keys):
+        by_name[key[2].casefold()].append(i)
+    
     # Process changes one by one in chronological order
     deletions_count = 0
     additions_count = 0
     
     for change in changes:
-        if len(change) == 2:
-            # Deletion: (date, name) - remove all rows with this name
-            name_to_delete = change[1].strip().lower()
-            original_count = len(rows)
-            rows = [row for row in rows if row.get('name', '').strip().lower() != name_to_delete]
-            removed = original_count - len(rows)
+        if isinstance(change, Deletion):
+            # Deletion: remove all rows with this name
+            name_to_delete = change.name.strip().casefold()
+            removed = 0
+            for i in by_name.pop(name_to_delete, []):
+                seen.discard(keys[i])
+                # Mark as removed; rows are compacted once all changes are applied
+                rows[i] = None
+                removed += 1
             if removed > 0:
                 deletions_count += removed
-                print(f"Removed {removed} row(s) for deletion: {change[1]}", file=sys.stderr)
+                log(f"Removed {removed} row(s) for deletion: {change.name}")
         else:
-            # Addition: (date, name, address) - add new row only if it doesn't already exist
-            date_str = change[0].strftime("%Y-%m-%d")
-            address = change[2].lower().strip()
-            name = change[1].strip()
+            # Addition: add new row only if it doesn't already exist
+            row = {
+                'date_added': change.date.strftime("%Y-%m-%d"),
+                'address': change.address,
+                'name': change.name
+            }
             
             # Check if this exact entry already exists (same date, address, and name)
-            already_exists = False
-            for row in rows:
-                existing_date = row.get('date_added', '').strip()
-                existing_address = row.get('address', '').lower().strip()
-                existing_name = row.get('name', '').strip()
-                
-                if (existing_date == date_str and 
-                    existing_address == address and 
-                    existing_name == name):
-                    already_exists = True
-                    break
-            
-            if not already_exists:
-                rows.append({
-                    'date_added': date_str,
-                    'address': change[2],
-                    'name': change[1]
-                })
+            key = _row_key(row)
+            if key not in seen:
+                seen.add(key)
+                by_name[key[2].casefold()].append(len(rows))
+                keys.append(key)
+                rows.append(row)
                 additions_count += 1
-                print(f"Added row: {change[1]} - {change[2]}", file=sys.stderr)
+                log(f"Added row: {change.name} - {change.address}")
             else:
-                print(f"Skipped duplicate: {change[1]} - {change[2]}", file=sys.stderr)
+                log(f"Skipped duplicate: {change.name} - {change.address}")
+    
+    rows = [row for row in rows if row is not None]
     
-    # Write back to CSV with all names quoted (to match original format)
+    # Write back to CSV with all names quoted (to match original format).
+    # csv.writer cannot force-quote a single column, so rows are formatted
+    # by hand and written in one pass through a large buffer.
     try:
-        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        with open(csv_path, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
             # Write header
             f.write('date_added,address,name\n')
-            for row in rows:
-                date_added = row.get('date_added', '')
-                address = row.get('address', '')
-                name = row.get('name', '')
-                # Escape quotes in name by doubling them (CSV standard)
-                escaped_name = name.replace('"', '""')
-                # Always quote the name field
-                f.write(f'{date_added},{address},"{escaped_name}"\n')
+            f.writelines(_format_csv_row(row) for row in rows)
         
-        print(f"Updated {csv_path}: {deletions_count} deletion(s), {additions_count} addition(s)", file=sys.stderr)
+        log(f"Updated {csv_path}: {deletions_count} deletion(s), {additions_count} addition(s)")
     except Exception as e:
-        print(f"Error writing to {csv_path}: {e}", file=sys.stderr)
+        log(f"Error writing to {csv_path}: {e}")
+
+
+def lookup_eth_addresses(name: str, kind: str) -> List[str]:
+    """Search OFAC for an added name and collect the ETH addresses of its matches.
+    
+    Args:
+        name: Individual or entity name from a content page
+        kind: "individual" or "entity", used for logging
+    
+    Returns:
+        List of Ethereum addresses found on the matching detail pages
+    """
+    addresses = []
+    
+    # Logged as one block so concurrent lookups don't interleave
+    with buffered_log():
+        log(f"  Querying search for {kind}: {name}")
+        search_results = query_ofac_search(name)
+        log(f"  Found {len(search_results)} search result(s) for {name}")
+        
+        # Only process if the found name contains the query name (case-insensitive)
+        query_name = name.strip().casefold()
+        detail_urls = [
+            result['detail_url']
+            for result in search_results
+            if query_name in result.get('name', '').casefold() and result['detail_url']
+        ]
+        for detail_url in detail_urls:
+            log(f"  Fetching detail page: {detail_url}")
+        
+        # Fetch the detail pages of several matches concurrently, keeping their
+        # log lines in this name's block
+        if len(detail_urls) > 1:
+            futures = [
+                _DETAIL_EXECUTOR.submit(_call_buffered, get_identification_details, url)
+                for url in detail_urls
+            ]
+            identification_lists = []
+            for future in futures:
+                identifications, lines = future.result()
+                _LOG_BUFFER.lines.extend(lines)
+                identification_lists.append(identifications)
+        else:
+            identification_lists = [get_identification_details(url) for url in detail_urls]
+        
+        for identifications in identification_lists:
+            log(f"  Found {len(identifications)} identification(s)")
+            # should be eth addresses
+            addresses.extend(extract_eth_address(identifications))
+    
+    return addresses
+
+
+def fetch_listing_page(page: int) -> Optional[List[tuple[str, datetime]]]:
+    """Fetch one page of the recent-actions listing (newest first).
+    
+    Returns:
+        List of (content page URL, date) tuples, empty past the last page,
+        or None if the page could not be fetched
+    """
+    url = f"{LIST_URL}?page={page}"
+    log(f"Fetching page {page}...")
+    
+    try:
+        response = SESSION.get(url, timeout=30)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        log(f"Error fetching {url}: {e}")
+        return None
+    
+    return extract_content_links(response.content, BASE_URL)
+
+
+def _reaches_date(links: Optional[List[tuple[str, datetime]]], date: datetime) -> bool:
+    """Check whether a listing page has a link dated on or before date.
+    
+    Empty or failed pages also count, so searches stop at them.
+    """
+    return not links or min(link_date for _, link_date in links) <= date
+
+
+def find_first_listing_page(end_date: datetime) -> tuple[int, Optional[List[tuple[str, datetime]]]]:
+    """Find the first listing page that can hold links dated on or before end_date.
+    
+    Pages entirely newer than end_date are skipped with an exponential probe
+    (pages 1, 2, 4, 8, ...) followed by a binary search, so backfilling an old
+    date range does not walk every newer page.
+    
+    Returns:
+        tuple: (page number, links on that page as returned by fetch_listing_page)
+    """
+    links = fetch_listing_page(0)
+    if _reaches_date(links, end_date):
+        return 0, links
+    
+    # lo is always a page entirely newer than end_date, hi one that is not
+    lo, hi = 0, 1
+    hi_links = fetch_listing_page(hi)
+    while not _reaches_date(hi_links, end_date):
+        lo, hi = hi, hi * 2
+        hi_links = fetch_listing_page(hi)
+    
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        links = fetch_listing_page(mid)
+        if _reaches_date(links, end_date):
+            hi, hi_links = mid, links
+        else:
+            lo = mid
+    
+    return hi, hi_links
 
 
 def collect_content_pages(start_date: datetime, end_date: datetime) -> List[tuple[str, datetime]]:
     """Collect all content page URLs and dates within the date range."""
-    base_url = "https://ofac.treasury.gov"
-    list_url = f"{base_url}/recent-actions/sanctions-list-updates"
     content_pages = []
-    page = 0
+    page, links = find_first_listing_page(end_date)
+    batch = [links]
     
-    with requests.Session() as session:
+    with ThreadPoolExecutor(max_workers=LISTING_BATCH_SIZE) as executor:
         while True:
-            url = f"{list_url}?page={page}"
-            print(f"Fetching page {page}...", file=sys.stderr)
-            
-            try:
-                response = session.get(url, timeout=30)
-                response.raise_for_status()
-            except requests.RequestException as e:
-                print(f"Error fetching {url}: {e}", file=sys.stderr)
-                break
-            
-            links = extract_content_links(response.text, base_url)
-            
-            if not links:
-                print("No more links found", file=sys.stderr)
-                break
-            
-            # Filter links within date range
-            for link_url, link_date in links:
-                if start_date <= link_date <= end_date:
-                    content_pages.append((link_url, link_date))
-                elif link_date < start_date:
-                    # We've gone past the start date, stop
-                    print(f"Reached start date {start_date.date()}", file=sys.stderr)
+            for links in batch:
+                if links is None:
+                    return content_pages
+                
+                if not links:
+                    log("No more links found")
                     return content_pages
+                
+                # Filter links within date range
+                for link_url, link_date in links:
+                    if start_date <= link_date <= end_date:
+                        content_pages.append((link_url, link_date))
+                    elif link_date < start_date:
+                        # We've gone past the start date, stop
+                        log(f"Reached start date {start_date.date()}")
+                        return content_pages
+                
+                page += 1
             
-            page += 1
-    
-    return content_pages
+            # Fetch the following listing pages a batch at a time; map() keeps them in order
+            batch = executor.map(fetch_listing_page, range(page, page + LISTING_BATCH_SIZE))
 
 
 def test_entity_eth_address():
@@ -591,43 +846,43 @@ def test_entity_eth_address():
     test_name = "FUNNULL TECHNOLOGY INC"
     expected_address = "0xd5ED34b52AC4ab84d8FA8A231a3218bbF01Ed510"
     
-    print(f"Testing entity: {test_name}", file=sys.stderr)
-    print(f"Expected ETH address: {expected_address}", file=sys.stderr)
+    log(f"Testing entity: {test_name}")
+    log(f"Expected ETH address: {expected_address}")
     
     search_results = query_ofac_search(test_name)
     
     if not search_results:
-        print("ERROR: No search results found", file=sys.stderr)
+        log("ERROR: No search results found")
         return False
     
-    print(f"Found {len(search_results)} search result(s)", file=sys.stderr)
+    log(f"Found {len(search_results)} search result(s)")
     
     found_addresses = []
     for result in search_results:
-        print(f"  - {result['name']} ({result['type']})", file=sys.stderr)
+        log(f"  - {result['name']} ({result['type']})")
         if result['detail_url']:
-            print(f"  Fetching detail URL: {result['detail_url']}", file=sys.stderr)
+            log(f"  Fetching detail URL: {result['detail_url']}")
             identifications = get_identification_details(result['detail_url'])
-            print(f"  Found {len(identifications)} identifications", file=sys.stderr)
+            log(f"  Found {len(identifications)} identifications")
             for ident in identifications:
-                print(f"    - {ident['type']}: {ident['id_number']}", file=sys.stderr)
+                log(f"    - {ident['type']}: {ident['id_number']}")
             eth_addresses = extract_eth_address(identifications)
             if eth_addresses:
                 found_addresses.extend(eth_addresses)
-                print(f"Found ETH addresses: {eth_addresses}", file=sys.stderr)
+                log(f"Found ETH addresses: {eth_addresses}")
         else:
-            print(f"  ERROR: No detail_url found for result", file=sys.stderr)
+            log(f"  ERROR: No detail_url found for result")
     
     if found_addresses:
         expected_lower = expected_address.lower()
         if expected_lower in found_addresses:
-            print("SUCCESS: Found correct ETH address!", file=sys.stderr)
+            log("SUCCESS: Found correct ETH address!")
             return True
         else:
-            print(f"WARNING: Found ETH addresses {found_addresses} but expected {expected_address} not found", file=sys.stderr)
+            log(f"WARNING: Found ETH addresses {found_addresses} but expected {expected_address} not found")
             return False
     else:
-        print("ERROR: No ETH address found", file=sys.stderr)
+        log("ERROR: No ETH address found")
         return False
 
 
@@ -637,37 +892,40 @@ def main():
         success = test_entity_eth_address()
         sys.exit(0 if success else 1)
     
+    # Load existing names and rows from data.csv
+    existing_names, csv_last_date, rows = load_data_csv()
+    
     # Check argument count
     if len(sys.argv) == 1:
         # No arguments: use last processed date from log.txt or data.csv
-        last_date = get_last_processed_date()
+        last_date = get_last_processed_date(csv_last_date=csv_last_date)
         if last_date is None:
-            print(f"Error: No previous date found. Please specify a start date.", file=sys.stderr)
-            print(f"\nUsage:", file=sys.stderr)
-            print(f"  {sys.argv[0]}                    # Continue from last processed date", file=sys.stderr)
-            print(f"  {sys.argv[0]} START_DATE        # Parse from START_DATE to now", file=sys.stderr)
-            print(f"  {sys.argv[0]} START_DATE END_DATE  # Parse from START_DATE to END_DATE", file=sys.stderr)
-            print(f"  {sys.argv[0]} --test            # Run test", file=sys.stderr)
+            log(f"Error: No previous date found. Please specify a start date.")
+            log(f"\nUsage:")
+            log(f"  {sys.argv[0]}                    # Continue from last processed date")
+            log(f"  {sys.argv[0]} START_DATE        # Parse from START_DATE to now")
+            log(f"  {sys.argv[0]} START_DATE END_DATE  # Parse from START_DATE to END_DATE")
+            log(f"  {sys.argv[0]} --test            # Run test")
             sys.exit(1)
         
         start_date = last_date
         end_date = datetime.now()
-        print(f"Continuing from last processed date: {start_date.date()}", file=sys.stderr)
+        log(f"Continuing from last processed date: {start_date.date()}")
     elif len(sys.argv) == 2:
         # Single date: parse from that date to now
         try:
             start_date = datetime.strptime(sys.argv[1], "%Y-%m-%d")
             end_date = datetime.now()
             if start_date > end_date:
-                print(f"Error: Date cannot be in the future", file=sys.stderr)
+                log(f"Error: Date cannot be in the future")
                 sys.exit(1)
         except ValueError:
-            print(f"Invalid date format. Use YYYY-MM-DD", file=sys.stderr)
-            print(f"\nUsage:", file=sys.stderr)
-            print(f"  {sys.argv[0]}                    # Continue from last processed date", file=sys.stderr)
-            print(f"  {sys.argv[0]} START_DATE        # Parse from START_DATE to now", file=sys.stderr)
-            print(f"  {sys.argv[0]} START_DATE END_DATE  # Parse from START_DATE to END_DATE", file=sys.stderr)
-            print(f"  {sys.argv[0]} --test            # Run test", file=sys.stderr)
+            log(f"Invalid date format. Use YYYY-MM-DD")
+            log(f"\nUsage:")
+            log(f"  {sys.argv[0]}                    # Continue from last processed date")
+            log(f"  {sys.argv[0]} START_DATE        # Parse from START_DATE to now")
+            log(f"  {sys.argv[0]} START_DATE END_DATE  # Parse from START_DATE to END_DATE")
+            log(f"  {sys.argv[0]} --test            # Run test")
             sys.exit(1)
     elif len(sys.argv) == 3:
         # Two dates: start and end
@@ -675,102 +933,99 @@ def main():
             start_date = datetime.strptime(sys.argv[1], "%Y-%m-%d")
             end_date = datetime.strptime(sys.argv[2], "%Y-%m-%d")
         except ValueError:
-            print(f"Invalid date format. Use YYYY-MM-DD", file=sys.stderr)
-            print(f"\nUsage:", file=sys.stderr)
-            print(f"  {sys.argv[0]}                    # Continue from last processed date", file=sys.stderr)
-            print(f"  {sys.argv[0]} START_DATE        # Parse from START_DATE to now", file=sys.stderr)
-            print(f"  {sys.argv[0]} START_DATE END_DATE  # Parse from START_DATE to END_DATE", file=sys.stderr)
-            print(f"  {sys.argv[0]} --test            # Run test", file=sys.stderr)
+            log(f"Invalid date format. Use YYYY-MM-DD")
+            log(f"\nUsage:")
+            log(f"  {sys.argv[0]}                    # Continue from last processed date")
+            log(f"  {sys.argv[0]} START_DATE        # Parse from START_DATE to now")
+            log(f"  {sys.argv[0]} START_DATE END_DATE  # Parse from START_DATE to END_DATE")
+            log(f"  {sys.argv[0]} --test            # Run test")
             sys.exit(1)
         
         if start_date > end_date:
-            print(f"Error: Start date must be before end date", file=sys.stderr)
+            log(f"Error: Start date must be before end date")
             sys.exit(1)
     else:
-        print(f"Usage:", file=sys.stderr)
-        print(f"  {sys.argv[0]}                    # Continue from last processed date", file=sys.stderr)
-        print(f"  {sys.argv[0]} START_DATE        # Parse from START_DATE to now", file=sys.stderr)
-        print(f"  {sys.argv[0]} START_DATE END_DATE  # Parse from START_DATE to END_DATE", file=sys.stderr)
-        print(f"  {sys.argv[0]} --test            # Run test", file=sys.stderr)
-        print(f"\nDates should be in format: YYYY-MM-DD", file=sys.stderr)
+        log(f"Usage:")
+        log(f"  {sys.argv[0]}                    # Continue from last processed date")
+        log(f"  {sys.argv[0]} START_DATE        # Parse from START_DATE to now")
+        log(f"  {sys.argv[0]} START_DATE END_DATE  # Parse from START_DATE to END_DATE")
+        log(f"  {sys.argv[0]} --test            # Run test")
+        log(f"\nDates should be in format: YYYY-MM-DD")
         sys.exit(1)
     
-    # Load existing names from data.csv
-    existing_names = load_existing_names()
-    
     content_pages = collect_content_pages(start_date, end_date)
     
     changes = []
     
     # Process content pages in reverse order (oldest to newest)
-    for content_url, content_date in reversed(content_pages):
-        print(f"\nProcessing: {content_url}", file=sys.stderr)
-        individuals_added, entities_added, deletions = extract_content_data(content_url)
+    content_pages = content_pages[::-1]
+    
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # Fetch content pages concurrently
+        page_futures = [executor.submit(extract_content_data, url) for url, _ in content_pages]
         
-        # Process individuals added
-        for name in individuals_added:
-            print(f"  Querying search for individual: {name}", file=sys.stderr)
-            search_results = query_ofac_search(name)
-            print(f"  Found {len(search_results)} search result(s) for {name}", file=sys.stderr)
-            for result in search_results:
-                # Only process if the found name contains the query name (case-insensitive)
-                found_name = result.get('name', '').strip().lower()
-                query_name = name.strip().lower()
-                if query_name not in found_name:
-                    continue
-                
-                if result['detail_url']:
-                    print(f"  Fetching detail page: {result['detail_url']}", file=sys.stderr)
-                    identifications = get_identification_details(result['detail_url'])
-                    print(f"  Found {len(identifications)} identification(s)", file=sys.stderr)
-                    # should be eth addresses
-                    eth_addresses = extract_eth_address(identifications)
-                    if eth_addresses:
-                        existing_names.add(name)
-                        for eth_address in eth_addresses:
-                            changes.append((content_date, name, eth_address))
-                            print(f"Found individual addition: {name} - {eth_address}", file=sys.stderr)
+        # Start the OFAC lookup for each added name as soon as its page is
+        # parsed, without waiting for slower pages. A name added on several
+        # pages is looked up once. Results are consumed below in page order.
+        lookups = {}
+        for page_future in as_completed(page_futures):
+            individuals_added, entities_added, _ = page_future.result()
+            for names, kind in ((individuals_added, "individual"), (entities_added, "entity")):
+                for name in names:
+                    if name not in lookups:
+                        lookups[name] = executor.submit(lookup_eth_addresses, name, kind)
         
-        # Process entities added
-        for name in entities_added:
-            print(f"  Querying search for entity: {name}", file=sys.stderr)
-            search_results = query_ofac_search(name)
-            print(f"  Found {len(search_results)} search result(s) for {name}", file=sys.stderr)
-            for result in search_results:
-                # Only process if the found name contains the query name (case-insensitive)
-                found_name = result.get('name', '').strip().lower()
-                query_name = name.strip().lower()
-                if query_name not in found_name:
-                    continue
-                
-                if result['detail_url']:
-                    print(f"  Fetching detail page: {result['detail_url']}", file=sys.stderr)
-                    identifications = get_identification_details(result['detail_url'])
-                    print(f"  Found {len(identifications)} identification(s)", file=sys.stderr)
-                    eth_addresses = extract_eth_address(identifications)
+        # Bound once rather than looked up for every change found
+        append_change = changes.append
+        
+        for (content_url, content_date), page_future in zip(content_pages, page_futures):
+            log(f"\nProcessing: {content_url}")
+            individuals_added, entities_added, deletions = page_future.result()
+            
+            # Drop repeats within a page (e.g. a name listed twice, or two search
+            # results sharing an address); a repeat has no effect on data.csv
+            seen = set()
+            
+            # Process individuals added, then entities added
+            for names, kind in ((individuals_added, "individual"), (entities_added, "entity")):
+                for name in names:
+                    eth_addresses = lookups[name].result()
                     if eth_addresses:
-                        existing_names.add(name)
+                        existing_names[name.casefold()] = name
                         for eth_address in eth_addresses:
-                            changes.append((content_date, name, eth_address))
-                            print(f"Found entity addition: {name} - {eth_address}", file=sys.stderr)
-        
-        # Process deletions - only add if name exists in data.csv
-        for name in deletions:
-            if name in existing_names:
-                changes.append((content_date, name))
-                print(f"Found deletion: {name}", file=sys.stderr)
+                            change = Addition(content_date, name, eth_address)
+                            if change in seen:
+                                continue
+                            seen.add(change)
+                            append_change(change)
+                            log(f"Found {kind} addition: {name} - {eth_address}")
+            
+            # Process deletions - only add if name exists in data.csv;
+            # matched case-insensitively like the removal in update_data_csv
+            # (dict.fromkeys drops repeated names while keeping page order)
+            # Aliases for the comprehension to capture, so content_date and
+            # existing_names stay fast locals of main()
+            _date, is_existing = content_date, existing_names.__contains__
+            page_deletions = [
+                Deletion(_date, name)
+                for name in dict.fromkeys(deletions)
+                if is_existing(name.casefold())
+            ]
+            for _, name in page_deletions:
+                log(f"Found deletion: {name}")
+            changes.extend(page_deletions)
     
-    # Output results to stdout
+    # Output results to stdout in a single write
+    output = []
     for change in changes:
-        if len(change) == 2:
-            # Deletion: (date, name)
-            print(f"Deletion: {change[0]} - {change[1]}")
+        if isinstance(change, Deletion):
+            output.append("Deletion: %s - %s\n" % change)
         else:
-            # Addition: (date, name, address)
-            print(f"Addition: {change[0]} - {change[1]} - {change[2]}")
+            output.append("Addition: %s - %s - %s\n" % change)
+    sys.stdout.write("".join(output))
     
     # Update data.csv with changes (processed in chronological order)
-    update_data_csv(changes)
+    update_data_csv(changes, rows=rows)
     
     # Save the end_date (last processed date) to log.txt for next run
     save_last_processed_date(end_date)